@@ -1,30 +1,43 @@
 import os
+import json
 import time
+import asyncio
+import functools
+import threading
 import tempfile
 import shutil
-from typing import List, Optional
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, NamedTuple, Optional
+from fastapi import FastAPI, Request, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+import msgspec
+import numpy as np
+import torch
 import whisper_at as whisper
-from collections import defaultdict
 import aiohttp
+import aiofiles
+import anyio
+import cachetools
+from blake3 import blake3
 
 # Define known vocal and instrumental tags
-VOCAL_TAGS = {
+VOCAL_TAGS = frozenset({
     "Singing", "Speech", "Female singing", "Male singing",
     "Child singing", "Vocal music", "Voice",
     "Male speech, man speaking", "Female speech, woman speaking",
     "Child speech, kid speaking", "Conversation", "Narration, monologue",
     "Narration", "Rapping", "Whispering"
-}
+})
 # Definitive speech tags that guarantee vocal classification
-DEFINITIVE_SPEECH_TAGS = {
+DEFINITIVE_SPEECH_TAGS = frozenset({
     "Male speech, man speaking", "Female speech, woman speaking",
     "Child speech, kid speaking", "Conversation", "Narration, monologue"
-}
+})
 # Strict instrumental tags - only actual instruments
-INSTRUMENTAL_TAGS = {
+INSTRUMENTAL_TAGS = frozenset({
     "Piano", "Electric piano", "Keyboard (musical)", "Synthesizer", "Organ",
     "Electronic organ", "Harpsichord", "Guitar", "Bass guitar", "Drums", "Violin",
     "Trumpet", "Flute", "Saxophone", "Plucked string instrument", "Electric guitar",
@@ -34,7 +47,40 @@ INSTRUMENTAL_TAGS = {
     "Marimba, xylophone", "Vibraphone", "Brass instrument", "French horn", "Trombone",
     "Bowed string instrument", "String section", "Violin, fiddle", "Cello", "Double bass",
     "Wind instrument, woodwind instrument", "Clarinet", "Harp", "Harmonica", "Accordion"
-}
+})
+
+# Bit flags for the tag classes above
+VOCAL_FLAG, INSTRUMENTAL_FLAG, DEFINITIVE_SPEECH_FLAG = 1, 2, 4
+
+# Class flags of every known tag, so each tag is classified with a single lookup
+TAG_FLAGS = {}
+for flag, tags in (
+    (VOCAL_FLAG, VOCAL_TAGS),
+    (INSTRUMENTAL_FLAG, INSTRUMENTAL_TAGS),
+    (DEFINITIVE_SPEECH_FLAG, DEFINITIVE_SPEECH_TAGS),
+):
+    for tag in tags:
+        TAG_FLAGS[tag] = TAG_FLAGS.get(tag, 0) | flag
+
+# English AudioSet label names, indexed like the audio tagging head's outputs
+with open(os.path.join(os.path.dirname(whisper.__file__), "assets", "label_name_dict.json")) as f:
+    LABEL_NAMES = json.load(f)["en"]
+
+# Class flags of every label, indexed by label id
+LABEL_FLAGS = np.array([TAG_FLAGS.get(name, 0) for name in LABEL_NAMES], dtype=np.uint8)
+LABEL_FLAGS.flags.writeable = False
+
+# Classification for every combination of class flags
+CLASSIFICATION_BY_FLAGS = (
+    "Unknown",             # no known tags
+    "Vocal Audio",         # vocal only
+    "Instrumental Audio",  # instrumental only
+    "Music",               # vocal and instrumental
+) + ("Vocal Audio",) * 4   # definitive speech guarantees vocal classification
+
+# Labels kept per tagging window, and the logit a label must exceed to count
+TOP_K = 15
+P_THRESHOLD = -5
 
 app = FastAPI(
     title="Audio Classification API",
@@ -51,90 +97,345 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Result of running the model on one audio file
+class AudioClassification(NamedTuple):
+    transcription: str
+    top_tags: List[str]
+    classification: str
+
 # Response models
-class AudioClassificationResponse(BaseModel):
+class AudioClassificationResponse(msgspec.Struct):
     transcription: str
     top_tags: List[str]
     classification: str
 
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response encoded by msgspec, which serializes Structs directly"""
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
+
 # Cache for the model to avoid reloading
 model_cache = {}
+model_lock = threading.Lock()
+
+# Device to run the model on (cuda or cpu), defaulting to CUDA when available
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE") or ("cuda" if torch.cuda.is_available() else "cpu")
+
+# Model size loaded and warmed up at startup
+WHISPER_SIZE = os.getenv("WHISPER_SIZE", "tiny")
+
+# Audio tagging time resolution in seconds (must be a multiple of 0.4)
+AUDIO_TAGGING_TIME_RESOLUTION = 4.8
+
+# Quantize the model's Linear layers to int8 when running on CPU
+WHISPER_INT8 = os.getenv("WHISPER_INT8", "0") == "1"
+
+# Compile the audio encoder with torch.compile (not combined with WHISPER_INT8)
+WHISPER_COMPILE = os.getenv("WHISPER_COMPILE", "0") == "1"
+
+# Size of the chunks used when streaming audio to disk
+CHUNK_SIZE = 1 << 20
+
+# Whether child processes can open our file descriptors through /proc (Linux)
+HAS_PROC_FD = os.path.isdir("/proc/self/fd")
+
+# Whether downloads can be buffered in memory-backed files instead of on disk
+HAS_MEMFD = HAS_PROC_FD and hasattr(os, "memfd_create")
+
+# Upper bound on how long a URL download may take
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=120)
+
+# Recent results keyed by "<blake3 of the audio bytes>:<model size>", so
+# re-uploads of the same audio skip decoding and inference
+RESULT_CACHE_SIZE = 1024
+RESULT_CACHE_TTL = 60 * 60
+result_cache = cachetools.TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+
+# Samples per piece when streaming a transcription: six tagging windows (28.8 s),
+# which keeps tagging windows aligned across pieces and fits whisper's 30 s input
+STREAM_CHUNK_SAMPLES = round(6 * AUDIO_TAGGING_TIME_RESOLUTION * whisper.audio.SAMPLE_RATE)
+
+# Pending inference jobs as (fn, audio, model_size, options, future), drained by batcher()
+inference_queue = asyncio.Queue()
+
+def quantize_int8(model):
+    """Dynamically quantize the model's Linear layers to int8 for CPU inference"""
+    for module in model.modules():
+        # whisper's Linear subclass only casts weights to the input dtype, which is
+        # a no-op in fp32, but quantize_dynamic only converts plain nn.Linear
+        if isinstance(module, torch.nn.Linear):
+            module.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+def compile_encoder(model):
+    """Compile the audio encoder for its fixed [1, 80, 3000] mel input and warm it up"""
+    encoder = torch.compile(model.encoder, mode="reduce-overhead", fullgraph=True)
+    dtype = torch.float16 if model.device.type == "cuda" else torch.float32
+    with torch.no_grad():
+        encoder(torch.zeros(
+            1, whisper.audio.N_MELS, whisper.audio.N_FRAMES, device=model.device, dtype=dtype
+        ))
+    return encoder
 
 def get_model(model_size: str = "tiny"):
     """Get or load the whisper model - using tiny to save space"""
-    if model_size not in model_cache:
-        print(f"Loading Whisper-AT model ({model_size})...")
-        start_time = time.time()
-        model_cache[model_size] = whisper.load_model(model_size)
-        print(f"Model loaded in {time.time() - start_time:.2f} seconds.")
-    return model_cache[model_size]
-
-def classify_audio(top_tags):
-    """Classify audio based on tags"""
-    # Check for definitive speech tags first - if any are present, it's definitely vocal
-    has_definitive_speech = any(tag in DEFINITIVE_SPEECH_TAGS for tag in top_tags)
-    
-    if has_definitive_speech:
-        return "Vocal Audio"
-    
-    # Regular classification logic as fallback
-    has_vocal = any(tag in VOCAL_TAGS for tag in top_tags)
-    has_instrumental = any(tag in INSTRUMENTAL_TAGS for tag in top_tags)
-
-    if has_vocal and not has_instrumental:
-        return "Vocal Audio"
-    elif has_instrumental and not has_vocal:
-        return "Instrumental Audio"
-    elif has_vocal and has_instrumental:
-        return "Music"
-    else:
-        return "Unknown"
-
-def process_audio_file(file_path: str, model_size: str = "tiny"):
-    """Process audio file and extract classification information - simplified for disk space"""
-    model = get_model(model_size)
-    audio_tagging_time_resolution = 4.8
-    
-    # Transcribe and tag the audio
-    result = model.transcribe(file_path, at_time_res=audio_tagging_time_resolution)
-    
-    # Parse audio tags
-    audio_tag_result = whisper.parse_at_label(
-        result,
-        language='en',
-        top_k=15,
-        p_threshold=-5
+    with model_lock:
+        if model_size not in model_cache:
+            print(f"Loading Whisper-AT model ({model_size})...")
+            start_time = time.time()
+            model = whisper.load_model(model_size, device=WHISPER_DEVICE)
+            if WHISPER_INT8 and model.device.type == "cpu":
+                model = quantize_int8(model)
+            elif WHISPER_COMPILE:
+                model.encoder = compile_encoder(model)
+            model_cache[model_size] = model
+            print(f"Model loaded in {time.time() - start_time:.2f} seconds.")
+        return model_cache[model_size]
+
+def transcribe(model, audio, **decode_options):
+    """Transcribe and tag audio, using FP16 when the model is on the GPU"""
+    if model.device.type == "cuda":
+        # Hand whisper the waveform on the GPU so the STFT and mel projection
+        # run there, against the filterbank whisper caches per device
+        audio = torch.from_numpy(audio).to(model.device)
+    return model.transcribe(
+        audio,
+        at_time_res=AUDIO_TAGGING_TIME_RESOLUTION,
+        fp16=model.device.type == "cuda",
+        **decode_options
     )
-    
-    # Process segments and collect tag frequency
-    tag_freq = defaultdict(int)
-    
-    for segment in audio_tag_result:
-        # Update tag frequency
-        for tag, _ in segment['audio tags']:
-            tag_freq[tag] += 1
-    
-    # Find top tags (those that appear more than once)
-    top_tags = [tag for tag, freq in tag_freq.items() if freq > 1]
+
+def warm_model(model_size: str = "tiny"):
+    """Load the model and run it once on a second of silence"""
+    model = get_model(model_size)
+    start_time = time.time()
+    transcribe(model, np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32))
+    print(f"Model warmed up in {time.time() - start_time:.2f} seconds.")
+
+def aggregate_tags(audio_tag: torch.Tensor) -> np.ndarray:
+    """Return ids of labels tagged in more than one window, in first-seen order"""
+    values, indices = torch.topk(audio_tag, k=TOP_K, dim=-1)
+    # Boolean indexing keeps row-major order: by window, then by descending score
+    ids = indices[values > P_THRESHOLD].numpy()
+    unique_ids, first_seen, counts = np.unique(ids, return_index=True, return_counts=True)
+    repeated = counts > 1
+    return unique_ids[repeated][np.argsort(first_seen[repeated])]
+
+def summarize(transcription: str, audio_tag: torch.Tensor) -> AudioClassification:
+    """Pick the top tags from the tagging logits and classify the audio"""
+    # Find top tags (those that appear in more than one window)
+    top_ids = aggregate_tags(audio_tag)
+    top_tags = [LABEL_NAMES[i] for i in top_ids]
     
     # Get classification
-    classification = classify_audio(top_tags)
+    classification = CLASSIFICATION_BY_FLAGS[np.bitwise_or.reduce(LABEL_FLAGS[top_ids])]
     
-    return AudioClassificationResponse(
-        transcription=result["text"],
+    return AudioClassification(
+        transcription=transcription,
         top_tags=top_tags,
         classification=classification
     )
 
+def process_audio_file(audio: np.ndarray, model_size: str = "tiny"):
+    """Process audio file and extract classification information - simplified for disk space"""
+    # Transcribe and tag the audio
+    result = transcribe(get_model(model_size), audio)
+    return summarize(result["text"], result["audio_tag"])
+
+def transcribe_chunk(audio: np.ndarray, model_size: str = "tiny", language: Optional[str] = None):
+    """Transcribe and tag one piece of a streamed file, returning (text, language, audio_tag)"""
+    result = transcribe(get_model(model_size), audio, language=language)
+    return result["text"], result["language"], result["audio_tag"]
+
+async def batcher():
+    """Background worker that runs queued inference jobs in arrival order"""
+    # Dedicated single-slot limiter: whisper's decoder installs kv-cache hooks on
+    # shared modules, so one model must not run two transcriptions at once, and
+    # inference should not eat into the default thread pool used for file I/O
+    limiter = anyio.CapacityLimiter(1)
+    while True:
+        fn, audio, model_size, options, future = await inference_queue.get()
+        if future.done():
+            # The request was cancelled while waiting
+            continue
+
+        # Run one job per thread hop so each caller gets its result as soon as
+        # its own job finishes, not after the jobs queued behind it
+        try:
+            result = await anyio.to_thread.run_sync(
+                functools.partial(fn, audio, model_size, **options), limiter=limiter
+            )
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+async def queue_submit(fn, audio: np.ndarray, model_size: str = "tiny", **options):
+    """Enqueue fn(audio, model_size, **options) for the inference worker and wait for its result"""
+    future = asyncio.get_running_loop().create_future()
+    await inference_queue.put((fn, audio, model_size, options, future))
+    return await future
+
+@app.on_event("startup")
+async def start_batcher():
+    """Start the inference worker"""
+    app.state.batcher = asyncio.create_task(batcher())
+
+@app.on_event("startup")
+async def open_http_session():
+    """Open the HTTP client shared by URL downloads"""
+    app.state.http = aiohttp.ClientSession(
+        timeout=DOWNLOAD_TIMEOUT,
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    )
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """Close the shared HTTP client"""
+    await app.state.http.close()
+
+@app.on_event("startup")
+async def warm_up():
+    """Load and warm the default model before serving the first request"""
+    await run_in_threadpool(warm_model, WHISPER_SIZE)
+
+def fd_path(fd: int) -> str:
+    """Path under which ffmpeg can open one of this process's file descriptors"""
+    return f"/proc/{os.getpid()}/fd/{fd}"
+
+async def load_audio(file_path: str) -> np.ndarray:
+    """Decode an audio file to a 16 kHz mono float32 waveform with ffmpeg"""
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", file_path,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le",
+        "-ar", str(whisper.audio.SAMPLE_RATE), "-",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        pcm, err = await proc.communicate()
+    except BaseException:
+        # Don't leave ffmpeg decoding for a request that has gone away
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    if proc.returncode != 0:
+        raise RuntimeError(f"Failed to load audio: {err.decode(errors='replace')}")
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+@contextmanager
+def audio_buffer(filename: str = "temp_audio_file"):
+    """Yield (fd, path) of an in-memory file on Linux, or of a temporary file elsewhere"""
+    if HAS_MEMFD:
+        # Memory-backed file, freed as soon as the descriptor is closed
+        fd = os.memfd_create("audio")
+        try:
+            yield fd, fd_path(fd)
+        finally:
+            os.close(fd)
+        return
+
+    temp_dir = tempfile.mkdtemp()
+    temp_file_path = os.path.join(temp_dir, filename)
+    fd = os.open(temp_file_path, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        yield fd, temp_file_path
+    finally:
+        os.close(fd)
+        shutil.rmtree(temp_dir)
+
+def hash_file(f) -> str:
+    """Return the blake3 hex digest of a file object's contents, rewinding it afterwards"""
+    hasher = blake3()
+    while chunk := f.read(CHUNK_SIZE):
+        hasher.update(chunk)
+    f.seek(0)
+    return hasher.hexdigest()
+
+async def hash_chunks(chunks, hasher):
+    """Pass an async stream of byte chunks through, feeding each to a hasher"""
+    async for chunk in chunks:
+        hasher.update(chunk)
+        yield chunk
+
+async def write_chunks(fd: int, chunks):
+    """Write an async stream of byte chunks to a file descriptor"""
+    async with aiofiles.open(fd, "wb", closefd=False) as buffer:
+        async for chunk in chunks:
+            await buffer.write(chunk)
+
+async def upload_chunks(file: UploadFile):
+    """Read an upload in CHUNK_SIZE pieces"""
+    while chunk := await file.read(CHUNK_SIZE):
+        yield chunk
+
+@asynccontextmanager
+async def spool_upload(file: UploadFile):
+    """Yield a path ffmpeg can read the upload from, copying it only when needed"""
+    if HAS_PROC_FD:
+        # Starlette has already spooled the upload to a temporary file, so hand
+        # out its descriptor instead of writing a second copy. Asking for the
+        # descriptor rolls small in-memory uploads over to disk.
+        yield fd_path(await run_in_threadpool(file.file.fileno))
+        return
+
+    with audio_buffer(file.filename) as (fd, temp_file_path):
+        await write_chunks(fd, upload_chunks(file))
+        yield temp_file_path
+
+def sse_event(event: str, data) -> bytes:
+    """Encode one Server-Sent Event with a JSON payload"""
+    return b"event: " + event.encode() + b"\ndata: " + msgspec.json.encode(data) + b"\n\n"
+
+async def stream_classification(
+    audio: Optional[np.ndarray],
+    model_size: str,
+    cache_key: str,
+    result: Optional[AudioClassification] = None
+):
+    """Yield a "segment" event per transcribed piece of audio, then the "result" event
+    
+    Piecewise transcription differs from a whole-file one, so a streamed result is
+    cached under its own "<cache_key>:stream" key and never served as plain JSON.
+    """
+    try:
+        if result is None:
+            texts, audio_tags, language = [], [], None
+            for start in range(0, max(len(audio), 1), STREAM_CHUNK_SAMPLES):
+                text, language, audio_tag = await queue_submit(
+                    transcribe_chunk,
+                    audio[start:start + STREAM_CHUNK_SAMPLES],
+                    model_size,
+                    language=language
+                )
+                texts.append(text)
+                audio_tags.append(audio_tag)
+                yield sse_event("segment", {"text": text})
+            result = summarize("".join(texts), torch.cat(audio_tags))
+            result_cache[f"{cache_key}:stream"] = result
+        
+        yield sse_event("result", AudioClassificationResponse(*result))
+    
+    except Exception as e:
+        yield sse_event("error", {"detail": f"Error processing audio: {str(e)}"})
+
 @app.post("/classify")
 async def classify_audio_endpoint(
-    background_tasks: BackgroundTasks,
+    request: Request,
     file: UploadFile = File(...),
     model_size: str = "tiny"
 ):
     """
     Upload an audio file and get classification results.
     
+    Send `Accept: text/event-stream` to receive the transcription as Server-Sent
+    Events while it is produced, followed by a final `result` event.
+    
     - **file**: The audio file to analyze
     - **model_size**: Whisper model size (tiny, base, small)
     """
@@ -145,28 +446,38 @@ async def classify_audio_endpoint(
             detail=f"Invalid model size. Choose from: tiny, base, small"
         )
     
-    # Create a temporary directory
-    temp_dir = tempfile.mkdtemp()
-    temp_file_path = os.path.join(temp_dir, file.filename)
-    
     try:
-        # Save the uploaded file
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        stream = "text/event-stream" in request.headers.get("accept", "")
         
-        # Process the audio
-        result = process_audio_file(temp_file_path, model_size)
+        # Look up the result of an earlier upload of the same audio; streamed
+        # requests may also reuse an earlier streamed result
+        cache_key = f"{await run_in_threadpool(hash_file, file.file)}:{model_size}"
+        result = result_cache.get(cache_key)
+        if result is None and stream:
+            result = result_cache.get(f"{cache_key}:stream")
         
-        # Clean up in the background after response is sent
-        background_tasks.add_task(shutil.rmtree, temp_dir)
+        audio = None
+        if result is None:
+            # Save and decode the uploaded file
+            async with spool_upload(file) as temp_file_path:
+                audio = await load_audio(temp_file_path)
         
-        return result
+        if stream:
+            return StreamingResponse(
+                stream_classification(audio, model_size, cache_key, result),
+                media_type="text/event-stream"
+            )
+        
+        if result is None:
+            # Process the audio
+            result = result_cache[cache_key] = await queue_submit(
+                process_audio_file, audio, model_size
+            )
+        
+        return MsgspecJSONResponse(AudioClassificationResponse(*result))
         
     except Exception as e:
-        # Clean up and raise exception
-        shutil.rmtree(temp_dir)
         raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
-      # Add this import for async HTTP download
 
 class URLClassificationRequest(BaseModel):
     url: str
@@ -176,10 +487,7 @@ class URLClassificationRequest(BaseModel):
     model_size: Optional[str] = "tiny"
 
 @app.post("/classify_url")
-async def classify_audio_from_url(
-    background_tasks: BackgroundTasks,
-    request: URLClassificationRequest
-):
+async def classify_audio_from_url(request: URLClassificationRequest):
     """
     Classify audio from a public URL and return result with metadata.
     
@@ -192,36 +500,37 @@ async def classify_audio_from_url(
     if request.model_size not in ["tiny", "base", "small"]:
         raise HTTPException(status_code=400, detail="Invalid model size.")
 
-    # Create temp dir
-    temp_dir = tempfile.mkdtemp()
-    temp_file_path = os.path.join(temp_dir, "temp_audio_file")
-
     try:
-        # Download audio file from URL
-        async with aiohttp.ClientSession() as session:
-            async with session.get(request.url) as resp:
+        hasher = blake3()
+        with audio_buffer() as (fd, temp_file_path):
+            # Download audio file from URL, hashing it on the way
+            async with app.state.http.get(request.url) as resp:
                 if resp.status != 200:
                     raise HTTPException(status_code=400, detail="Failed to download audio.")
-                with open(temp_file_path, 'wb') as f:
-                    f.write(await resp.read())
+                await write_chunks(fd, hash_chunks(resp.content.iter_chunked(CHUNK_SIZE), hasher))
 
-        # Process downloaded file
-        result = process_audio_file(temp_file_path, request.model_size)
+            # Look up the result of an earlier download of the same audio
+            cache_key = f"{hasher.hexdigest()}:{request.model_size}"
+            result = result_cache.get(cache_key)
 
-        # Schedule cleanup
-        background_tasks.add_task(shutil.rmtree, temp_dir)
+            if result is None:
+                # Decode downloaded file
+                audio = await load_audio(temp_file_path)
 
-        return {
+        if result is None:
+            # Process the audio
+            result = result_cache[cache_key] = await queue_submit(
+                process_audio_file, audio, request.model_size
+            )
+
+        return MsgspecJSONResponse({
             "user_id": request.user_id,
             "project_id": request.project_id,
             "audio_id": request.audio_id,
-            "transcription": result.transcription,
-            "top_tags": result.top_tags,
-            "classification": result.classification
-        }
+            **result._asdict()
+        })
 
     except Exception as e:
-        shutil.rmtree(temp_dir)
         raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
 
 @app.get("/")